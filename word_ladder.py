@@ -1,92 +1,274 @@
+from array import array
 from collections import deque, defaultdict
+from itertools import chain
 import heapq
-from typing import List, Set, Dict, Tuple, Optional, Callable
+from typing import Iterable, List, Set, Dict, Tuple, Optional
 import string
 import random
+import sys
+
+_INF = float('inf')
 
 class WordLadder:
-    def __init__(self, dictionary_words: Set[str]):
-        self.dictionary = {word.lower() for word in dictionary_words if word.isalpha()}
+    __slots__ = ('dictionary', 'difficulty_levels', 'banned_words', 'restricted_letters',
+                 '_path_cache', '_by_length', '_by_length_set', '_buckets', '_word_buckets',
+                 '_packed', '_letter_masks', '_restricted_mask', '_byte_mask', '_words', '_ids',
+                 '_indptr', '_indices', '_open_components', '_components')
+    
+    def __init__(self, dictionary_words: Iterable[str]):
+        # Single pass over any iterable of words (a set, or raw lines from a file).
+        # Words are packed as ASCII bytes below, so keep to plain a-z words
+        self.dictionary = frozenset(
+            sys.intern(word) for word in (raw.strip().lower() for raw in dictionary_words) 
+            if word.isascii() and word.isalpha()
+        )
         self.difficulty_levels = {
             'BEGINNER': {'min_length': 3, 'max_length': 4, 'max_moves': 5},
             'ADVANCED': {'min_length': 4, 'max_length': 5, 'max_moves': 7},
             'CHALLENGE': {'min_length': 5, 'max_length': 6, 'max_moves': 10, 'obstacles': True}
         }
-        self.banned_words = set()
-        self.restricted_letters = set()
+        self.banned_words = frozenset()
+        self.restricted_letters = frozenset()
+        # Restricted letters as a letter bitmask, see _letter_mask
+        self._restricted_mask = 0
+        # Hint paths keyed by (word, target, algorithm, banned, restricted)
+        self._path_cache: Dict[Tuple, List[str]] = {}
         
+        # Length index and wildcard index: "c*t" -> ["cat", "cot", "cut", ...]
+        by_length: Dict[int, List[str]] = defaultdict(list)
+        self._by_length_set: Dict[int, Set[str]] = defaultdict(set)
+        self._buckets: Dict[str, List[str]] = defaultdict(list)
+        # Per word, its wildcard bucket at each letter position (shared lists)
+        self._word_buckets: Dict[str, Tuple[List[str], ...]] = {}
+        # Each word packed into one int, one byte per letter, for XOR-based diffs
+        self._packed: Dict[str, int] = {}
+        # Each word's set of letters as a bitmask, for restricted-letter checks
+        self._letter_masks: Dict[str, int] = {}
+        for word in self.dictionary:
+            self._packed[word] = int.from_bytes(word.encode('ascii'), 'big')
+            self._letter_masks[word] = self._letter_mask(word)
+            by_length[len(word)].append(word)
+            self._by_length_set[len(word)].add(word)
+            word_buckets = []
+            for i in range(len(word)):
+                bucket = self._buckets[word[:i] + '*' + word[i+1:]]
+                bucket.append(word)
+                word_buckets.append(bucket)
+            self._word_buckets[word] = tuple(word_buckets)
+        self._by_length: Dict[int, Tuple[str, ...]] = {
+            length: tuple(sorted(words)) for length, words in by_length.items()
+        }
+        # Low bit of every byte position, used to count differing letters
+        self._byte_mask = int.from_bytes(b'\x01' * max(self._by_length, default=0), 'big')
+        
+        # Flat CSR adjacency for BFS, built on its first search (see _build_adjacency)
+        self._words: Tuple[str, ...] = ()
+        self._ids: Dict[str, int] = {}
+        self._indptr: Optional[array] = None
+        self._indices: Optional[array] = None
+            
+        # Connected components per word length, built on first use. Without obstacles
+        # they never change, so those are kept for the lifetime of the dictionary
+        self._open_components: Dict[int, Tuple[Dict[str, int], Dict[int, List[str]]]] = {}
+        self._components = self._open_components
+        
+    def _build_adjacency(self) -> None:
+        """Build the CSR adjacency over integer word ids.
+        
+        The neighbors of word id n are indices[indptr[n]:indptr[n+1]]. Only BFS walks
+        it, so it is built on the first search rather than with the dictionary.
+        """
+        self._words = tuple(sorted(self.dictionary))
+        self._ids = {word: word_id for word_id, word in enumerate(self._words)}
+        indptr = array('i', [0])
+        indices = array('i')
+        for word in self._words:
+            for bucket in self._word_buckets[word]:
+                for candidate in bucket:
+                    if candidate != word:
+                        indices.append(self._ids[candidate])
+            indptr.append(len(indices))
+        self._indptr, self._indices = indptr, indices
+
     def _get_neighbors(self, word: str) -> List[str]:
         """Generate all possible one-letter variations of the word that exist in dictionary."""
+        if not self.restricted_letters and not self.banned_words:
+            # No obstacles outside Challenge mode, so every bucket-mate is a neighbor
+            return [candidate for bucket in self._word_buckets[word] 
+                    for candidate in bucket if candidate != word]
+            
         neighbors = []
-        for i in range(len(word)):
-            for c in string.ascii_lowercase:
-                # Skip restricted letters in Challenge mode
-                if c in self.restricted_letters:
-                    continue
-                    
-                new_word = word[:i] + c + word[i+1:]
-                if (new_word in self.dictionary and 
-                    new_word != word and 
-                    new_word not in self.banned_words):
-                    neighbors.append(new_word)
+        letter_masks = self._letter_masks
+        restricted_mask = self._restricted_mask
+        for bucket in self._word_buckets[word]:
+            for candidate in bucket:
+                # Same rule as validate_move: restricted letters anywhere in the word
+                # and banned words are out in Challenge mode
+                if (candidate != word and 
+                    not letter_masks[candidate] & restricted_mask and 
+                    candidate not in self.banned_words):
+                    neighbors.append(candidate)
         return neighbors
 
     def get_random_word_pair(self, difficulty: str = 'BEGINNER') -> Tuple[str, str]:
         """Generate a random word pair based on difficulty level."""
         level = self.difficulty_levels[difficulty]
-        valid_words = [word for word in self.dictionary 
-                      if level['min_length'] <= len(word) <= level['max_length']]
+        valid_words = list(chain.from_iterable(
+            self._by_length.get(length, ()) 
+            for length in range(level['min_length'], level['max_length'] + 1)))
         
-        # Reset obstacles for new game
-        self.banned_words = set()
-        self.restricted_letters = set()
+        # Reset obstacles for new game (frozen, they don't change mid-game)
+        self._set_obstacles()
+        self._path_cache.clear()
         
         # Add obstacles for Challenge mode
         if difficulty == 'CHALLENGE' and level.get('obstacles', False):
             # Ban a few random words that aren't critical to solutions
-            potential_banned = random.sample(valid_words, min(10, len(valid_words)))
-            for word in potential_banned:
-                # Only ban if removing it doesn't disconnect the graph too much
-                self.banned_words.add(word)
-                if len(valid_words) > 50:  # Only restrict letters if we have enough words
-                    # Restrict 1-2 random letters
-                    self.restricted_letters = set(random.sample(string.ascii_lowercase, random.randint(1, 2)))
+            banned_words = random.sample(valid_words, min(10, len(valid_words)))
+            restricted_letters = ()
+            if len(valid_words) > 50:  # Only restrict letters if we have enough words
+                # Restrict 1-2 random letters
+                restricted_letters = random.sample(string.ascii_lowercase, random.randint(1, 2))
+            self._set_obstacles(banned_words, restricted_letters)
+        
+        # Only words still open under the obstacles have a component
+        components = {length: self._components_for(length) 
+                      for length in range(level['min_length'], level['max_length'] + 1)}
+        valid_pool = [word for word in valid_words if word in components[len(word)][0]]
         
         attempts = 0
-        while attempts < 100:  # Limit attempts to avoid infinite loop
-            start = random.choice(valid_words)
-            target = random.choice(valid_words)
-            if start != target and start not in self.banned_words and target not in self.banned_words:
-                # Verify that a path exists
-                if self.a_star(start, target):
-                    return start, target
+        while valid_pool and attempts < 100:  # Limit attempts to avoid infinite loop
+            start = random.choice(valid_pool)
+            # Words alone in their component have no target at all
+            component_of, members = components[len(start)]
+            if len(members[component_of[start]]) > 1:
+                # Only targets within the move limit can be won, and hinted
+                targets = self._words_within(start, level['max_moves'])
+                if targets:
+                    return start, random.choice(targets)
             attempts += 1
             
         # If we couldn't find a pair with obstacles, clear them and try again
-        self.banned_words = set()
-        self.restricted_letters = set()
+        self._set_obstacles()
         return self.get_random_word_pair(difficulty)
 
-    def get_hint(self, current_word: str, target_word: str, algorithm: str = 'a_star') -> Dict:
-        """Get the next best word in the optimal path using the specified algorithm."""
-        if algorithm == 'bfs':
-            path = self.bfs(current_word, target_word)
-        elif algorithm == 'ucs':
-            path = self.ucs(current_word, target_word)
-        else:  # Default to A*
-            path = self.a_star(current_word, target_word)
+    def _words_within(self, start_word: str, max_moves: int) -> List[str]:
+        """Words reachable from start_word in 1 to max_moves moves, in BFS order."""
+        seen = {start_word}
+        reached = []
+        frontier = [start_word]
+        for _ in range(max_moves):
+            next_frontier = []
+            for word in frontier:
+                for neighbor in self._get_neighbors(word):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            reached.extend(next_frontier)
+            frontier = next_frontier
+        return reached
+
+    def _set_obstacles(self, banned_words: Iterable[str] = (), restricted_letters: Iterable[str] = ()):
+        """Replace the banned words and restricted letters for the current game."""
+        self.banned_words = frozenset(banned_words)
+        self.restricted_letters = frozenset(restricted_letters)
+        self._restricted_mask = self._letter_mask(self.restricted_letters)
+        # Components depend on the obstacles, so start over unless there are none
+        if self.banned_words or self.restricted_letters:
+            self._components = {}
+        else:
+            self._components = self._open_components
+
+    @staticmethod
+    def _letter_mask(letters: Iterable[str]) -> int:
+        """Set bit ord(c) - ord('a') for every letter c."""
+        mask = 0
+        for c in letters:
+            mask |= 1 << (ord(c) - 97)
+        return mask
+
+    def _components_for(self, length: int) -> Tuple[Dict[str, int], Dict[int, List[str]]]:
+        """Connected components of the words of one length, via union-find over buckets.
+        
+        Banned words and words with a restricted letter are left out, as validate_move
+        rejects them. Returns each open word's component id, and the words of each
+        component.
+        """
+        components = self._components.get(length)
+        if components is not None:
+            return components
+            
+        banned_words = self.banned_words
+        letter_masks = self._letter_masks
+        restricted_mask = self._restricted_mask
+        words = [word for word in self._by_length.get(length, ()) 
+                 if word not in banned_words and not letter_masks[word] & restricted_mask]
+        parent = list(range(len(words)))
+        
+        def find(word_id: int) -> int:
+            while parent[word_id] != word_id:
+                # Path halving keeps the trees shallow
+                parent[word_id] = parent[parent[word_id]]
+                word_id = parent[word_id]
+            return word_id
+            
+        # Union every open word with the first open word seen in each of its buckets
+        bucket_firsts: Dict[int, int] = {}
+        for word_id, word in enumerate(words):
+            for bucket in self._word_buckets[word]:
+                first_id = bucket_firsts.setdefault(id(bucket), word_id)
+                if first_id != word_id:
+                    root, other_root = find(first_id), find(word_id)
+                    if root != other_root:
+                        parent[other_root] = root
+                        
+        component_of: Dict[str, int] = {}
+        members: Dict[int, List[str]] = defaultdict(list)
+        for word_id, word in enumerate(words):
+            root = find(word_id)
+            component_of[word] = root
+            members[root].append(word)
+        components = self._components[length] = (component_of, members)
+        return components
+
+    def get_hint(self, current_word: str, target_word: str, algorithm: str = 'a_star', 
+                 budget: Optional[int] = None) -> Dict:
+        """Get the next best word in the optimal path using the specified algorithm.
+        
+        If budget is given, only paths of at most that many moves count as found.
+        """
+        key = (current_word, target_word, algorithm, self.banned_words, self.restricted_letters)
+        path = self._path_cache.get(key)
+        if path is None:
+            if algorithm == 'bfs':
+                path = self.bfs(current_word, target_word)
+            elif algorithm == 'ucs':
+                path = self.ucs(current_word, target_word)
+            else:  # Default to A*
+                path = self.a_star(current_word, target_word, budget)
+            if path:
+                self._path_cache[key] = path
+                
+        # Paths are shortest paths, so one over budget means none fits
+        if path and budget is not None and len(path) - 1 > budget:
+            path = None
             
         if not path or len(path) <= 1:
+            explanation = "No valid path found."
+            if budget is not None:
+                explanation = f"No valid path found within {budget} moves."
             return {
                 'next_word': None,
-                'explanation': "No valid path found.",
+                'explanation': explanation,
                 'full_path': None
             }
             
         next_word = path[1]
         
         # Generate explanation
-        diff_index = next(i for i, (a, b) in enumerate(zip(current_word, next_word)) if a != b)
+        diff_index = self._diff_index(current_word, next_word)
         explanation = f"Change letter {diff_index + 1} from '{current_word[diff_index]}' to '{next_word[diff_index]}'."
         
         return {
@@ -95,37 +277,81 @@ class WordLadder:
             'full_path': path
         }
 
+    def advance_cached_paths(self, current_word: str, next_word: str, target_word: str) -> None:
+        """Move cached hint paths forward when the player steps along them."""
+        for key in list(self._path_cache):
+            if key[0] != current_word or key[1] != target_word:
+                continue
+            path = self._path_cache.pop(key)
+            if len(path) > 1 and path[1] == next_word:
+                self._path_cache[(next_word,) + key[1:]] = path[1:]
+
     def validate_move(self, current_word: str, next_word: str) -> bool:
         """Validate if the move is legal."""
-        if next_word not in self.dictionary or next_word in self.banned_words:
+        # Same-length lookup also rejects moves that add or drop letters
+        if (next_word not in self._by_length_set.get(len(current_word), ()) or 
+            next_word in self.banned_words or
+            self._letter_masks[next_word] & self._restricted_mask):
             return False
         
-        # Check if the move uses any restricted letters
-        for c in next_word:
-            if c in self.restricted_letters:
-                return False
-                
-        differences = sum(1 for a, b in zip(current_word, next_word) if a != b)
-        return differences == 1
+        current_bits = self._packed.get(current_word)
+        if current_bits is None:
+            current_bits = int.from_bytes(current_word.encode('ascii', 'replace'), 'big')
+        return self._count_differences(current_bits ^ self._packed[next_word]) == 1
+
+    def _reconstruct_path(self, parents: Dict[str, Optional[str]], word: str) -> List[str]:
+        """Walk parent pointers back from word to the search root."""
+        path = []
+        while word is not None:
+            path.append(word)
+            word = parents[word]
+        path.reverse()
+        return path
 
     def bfs(self, start_word: str, target_word: str) -> Optional[List[str]]:
         """Breadth-First Search implementation."""
         if start_word not in self.dictionary or target_word not in self.dictionary:
             return None
             
-        queue = deque([(start_word, [start_word])])
-        visited = {start_word}
+        # Search over integer ids on the CSR adjacency; -1 marks unvisited
+        if self._indptr is None:
+            self._build_adjacency()
+        words, indptr, indices = self._words, self._indptr, self._indices
+        start, target = self._ids[start_word], self._ids[target_word]
+        banned = {self._ids[word] for word in self.banned_words}
+        letter_masks = self._letter_masks
+        restricted_mask = self._restricted_mask
+        parents = array('i', [-1]) * len(words)
+        parents[start] = start
+        # A deque beats a preallocated array ring here: its append/popleft run in C,
+        # while a ring pays for head/tail index updates in Python bytecode
+        queue = deque([start])
         
         while queue:
-            current_word, path = queue.popleft()
+            current = queue.popleft()
             
-            if current_word == target_word:
+            if current == target:
+                path = [words[current]]
+                while current != start:
+                    current = parents[current]
+                    path.append(words[current])
+                path.reverse()
                 return path
                 
-            for neighbor in self._get_neighbors(current_word):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+            if not banned and not restricted_mask:
+                for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                    if parents[neighbor] == -1:
+                        parents[neighbor] = current
+                        queue.append(neighbor)
+                continue
+                
+            # Same rule as validate_move: no banned words, no restricted letter anywhere
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if (parents[neighbor] == -1 and 
+                    neighbor not in banned and 
+                    not letter_masks[words[neighbor]] & restricted_mask):
+                    parents[neighbor] = current
+                    queue.append(neighbor)
         
         return None
 
@@ -134,14 +360,16 @@ class WordLadder:
         if start_word not in self.dictionary or target_word not in self.dictionary:
             return None
             
-        priority_queue = [(0, start_word, [start_word])]
+        priority_queue = [(0, start_word)]
+        parents = {start_word: None}
+        costs: Dict[str, int] = {start_word: 0}
         visited = set()
         
         while priority_queue:
-            cost, current_word, path = heapq.heappop(priority_queue)
+            cost, current_word = heapq.heappop(priority_queue)
             
             if current_word == target_word:
-                return path
+                return self._reconstruct_path(parents, current_word)
                 
             if current_word in visited:
                 continue
@@ -149,44 +377,82 @@ class WordLadder:
             visited.add(current_word)
             
             for neighbor in self._get_neighbors(current_word):
-                if neighbor not in visited:
-                    new_cost = cost + 1
-                    heapq.heappush(priority_queue, (new_cost, neighbor, path + [neighbor]))
+                new_cost = cost + 1
+                if neighbor not in visited and new_cost < costs.get(neighbor, _INF):
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = current_word
+                    heapq.heappush(priority_queue, (new_cost, neighbor))
         
         return None
 
+    def _count_differences(self, diff_bits: int) -> int:
+        """Count the non-zero bytes of XOR-ed packed words, i.e. the differing letters."""
+        # Fold each byte down onto its low bit, then count those bits
+        diff_bits |= diff_bits >> 4
+        diff_bits |= diff_bits >> 2
+        diff_bits |= diff_bits >> 1
+        return (diff_bits & self._byte_mask).bit_count()
+
+    def _count_differences_batch(self, words: List[str], target_bits: int) -> List[int]:
+        """Count differing letters against one packed target for a batch of words."""
+        packed = self._packed
+        byte_mask = self._byte_mask
+        counts = []
+        for word in words:
+            diff_bits = packed[word] ^ target_bits
+            diff_bits |= diff_bits >> 4
+            diff_bits |= diff_bits >> 2
+            diff_bits |= diff_bits >> 1
+            counts.append((diff_bits & byte_mask).bit_count())
+        return counts
+
+    def _diff_index(self, word: str, other: str) -> int:
+        """Index of the first letter where two equal-length words differ."""
+        # The highest set bit of the XOR falls in the leftmost differing byte
+        diff_bits = self._packed[word] ^ self._packed[other]
+        return len(word) - 1 - (diff_bits.bit_length() - 1) // 8
+
     def _calculate_heuristic(self, word: str, target: str) -> int:
         """Calculate heuristic value (number of different letters) for A* search."""
-        return sum(1 for a, b in zip(word, target) if a != b)
+        return self._count_differences(self._packed[word] ^ self._packed[target])
 
-    def a_star(self, start_word: str, target_word: str) -> Optional[List[str]]:
-        """A* Search implementation."""
+    def a_star(self, start_word: str, target_word: str, budget: Optional[int] = None) -> Optional[List[str]]:
+        """A* Search implementation, optionally limited to paths of at most budget moves."""
         if start_word not in self.dictionary or target_word not in self.dictionary:
             return None
             
-        open_set = [(self._calculate_heuristic(start_word, target_word), 0, start_word, [start_word])]
+        # The heuristic never overestimates, so any f-score above the budget is a dead end
+        max_f_score = _INF if budget is None else budget
+        packed = self._packed
+        target_bits = packed[target_word]
+        open_set = [(self._count_differences(packed[start_word] ^ target_bits), 0, start_word)]
         visited = set()
-        g_scores = defaultdict(lambda: float('inf'))
-        g_scores[start_word] = 0
+        parents = {start_word: None}
+        g_scores: Dict[str, int] = {start_word: 0}
         
         while open_set:
-            _, g_score, current_word, path = heapq.heappop(open_set)
+            _, g_score, current_word = heapq.heappop(open_set)
             
             if current_word == target_word:
-                return path
+                return self._reconstruct_path(parents, current_word)
                 
             if current_word in visited:
                 continue
                 
             visited.add(current_word)
             
-            for neighbor in self._get_neighbors(current_word):
-                tentative_g_score = g_score + 1
-                
-                if tentative_g_score < g_scores[neighbor]:
-                    g_scores[neighbor] = tentative_g_score
-                    f_score = tentative_g_score + self._calculate_heuristic(neighbor, target_word)
-                    heapq.heappush(open_set, (f_score, tentative_g_score, neighbor, path + [neighbor]))
+            tentative_g_score = g_score + 1
+            improved = [neighbor for neighbor in self._get_neighbors(current_word) 
+                        if tentative_g_score < g_scores.get(neighbor, _INF)]
+            
+            # Score the whole expansion in one pass, then push it
+            for neighbor, h_score in zip(improved, self._count_differences_batch(improved, target_bits)):
+                f_score = tentative_g_score + h_score
+                if f_score > max_f_score:
+                    continue
+                g_scores[neighbor] = tentative_g_score
+                parents[neighbor] = current_word
+                heapq.heappush(open_set, (f_score, tentative_g_score, neighbor))
         
         return None
         
@@ -197,15 +463,26 @@ class WordLadder:
             len(start_word) != len(target_word)):
             return False
             
-        # Check if a path exists
-        return bool(self.a_star(start_word, target_word))
+        # A path exists iff both words share a component; a start word that is
+        # itself blocked can still step onto an open neighbor
+        component_of = self._components_for(len(target_word))[0]
+        target_root = component_of.get(target_word)
+        if target_root is None:
+            return False
+        if component_of.get(start_word) == target_root:
+            return True
+        return any(component_of.get(neighbor) == target_root 
+                   for neighbor in self._get_neighbors(start_word))
 
 class WordLadderGame:
+    __slots__ = ('word_ladder', 'current_game', 'history', 'hint_algorithm')
+    
     def __init__(self, dictionary_path: str = None):
         # If no dictionary provided, use a default set of words
         if dictionary_path:
+            # Stream lines straight into WordLadder, which cleans them in one pass
             with open(dictionary_path, 'r') as f:
-                dictionary = set(word.strip().lower() for word in f)
+                self.word_ladder = WordLadder(f)
         else:
             # Default dictionary for demo
             dictionary = {'cat', 'cot', 'cog', 'dog', 'dot', 'lot', 'log', 'hot', 
@@ -216,8 +493,8 @@ class WordLadderGame:
                         'phase', 'phone', 'prone', 'prune', 'prude', 'pride',
                         'prize', 'price', 'slice', 'spice', 'spine', 'shine',
                         'shone', 'stone', 'store', 'score', 'scare', 'share'}
+            self.word_ladder = WordLadder(dictionary)
         
-        self.word_ladder = WordLadder(dictionary)
         self.current_game = None
         self.history = []
         self.hint_algorithm = 'a_star'  # Default algorithm
@@ -269,6 +546,11 @@ class WordLadderGame:
         if not self.word_ladder.validate_move(self.current_game['current_word'], next_word):
             raise ValueError("Invalid move")
             
+        self.word_ladder.advance_cached_paths(
+            self.current_game['current_word'],
+            next_word,
+            self.current_game['target_word']
+        )
         self.current_game['moves'] += 1
         self.current_game['current_word'] = next_word
         self.current_game['path'].append(next_word)
@@ -299,10 +581,12 @@ class WordLadderGame:
         hint_data = self.word_ladder.get_hint(
             self.current_game['current_word'],
             self.current_game['target_word'],
-            self.hint_algorithm
+            self.hint_algorithm,
+            self.current_game['max_moves'] - self.current_game['moves']
         )
         
-        if detail_level == 'full' and hint_data['full_path']:
+        # Full hints always carry 'full_path', None when there is no path
+        if detail_level == 'full':
             return hint_data
         else:
             return {
@@ -313,7 +597,7 @@ class WordLadderGame:
     def get_dictionary_words(self, length: int = None) -> List[str]:
         """Get a list of dictionary words, optionally filtered by length."""
         if length:
-            return [word for word in self.word_ladder.dictionary if len(word) == length]
+            return list(self.word_ladder._by_length.get(length, ()))
         return list(self.word_ladder.dictionary)
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ import pygame
 import sys
 import random
 from word_ladder import WordLadderGame
-from typing import Optional, Tuple, Dict, List
+from typing import Optional, Tuple, Dict, List, Set
 import string
 import math
 
@@ -28,6 +28,7 @@ WHITE = (255, 255, 255)
 BLACK = (30, 30, 30)
 GRAY = (158, 158, 158)
 LIGHT_GRAY = (240, 240, 240)
+TEXT_SHADOW_COLOR = (*BLACK, 128)
 ALGORITHM_COLORS = {
     'bfs': (52, 152, 219),  # Blue
     'ucs': (155, 89, 182),  # Purple
@@ -48,25 +49,175 @@ GRAPH_CENTER_X = WINDOW_WIDTH // 2
 GRAPH_CENTER_Y = WINDOW_HEIGHT // 2
 ANIMATION_SPEED = 0.05
 HOVER_SCALE = 1.05
+FPS = 60
+IDLE_FPS = 15  # Redraw rate while the window is in the background
+TITLE_PULSE_FRAMES = 24  # Title renders per period of its pulse
+CURSOR_BLINK_MS = 500  # Input cursor blink period, half of it visible
+ERROR_SHAKE_MS = 1000 * 10 // FPS  # The input box error shake lasts ten 60 FPS frames
+
+# Characters the input boxes accept
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# Fonts and rendered text are reused across frames instead of rebuilt every draw
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+_TEXT_CACHE: Dict[Tuple[str, int, Tuple[int, ...]], pygame.Surface] = {}
+_TEXT_CACHE_LIMIT = 512
+
+# pygame-ce's fblits skips building the list of changed rects that blits returns
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+def get_font(size: int) -> pygame.font.Font:
+    """Return the default font at the given size, loading it only once."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a long-lived SRCALPHA surface to the display's pixel format, once a window exists."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+def render_text(text: str, size: int, color: Tuple[int, ...]) -> pygame.Surface:
+    """Return text rendered in the default font, rendering each (text, size, color) once.
+    
+    The returned Surface is shared, so callers must not draw on it or change its alpha.
+    """
+    key = (text, size, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_LIMIT:
+            _TEXT_CACHE.clear()
+        surface = _TEXT_CACHE[key] = to_display_format(get_font(size).render(text, True, color))
+    return surface
+
+_GRADIENT_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+def get_button_gradient(width: int, height: int) -> pygame.Surface:
+    """Return the translucent rounded highlight for the top half of a width x height button."""
+    key = (width, height)
+    gradient = _GRADIENT_CACHE.get(key)
+    if gradient is None:
+        gradient = _GRADIENT_CACHE[key] = to_display_format(pygame.Surface((width, height // 2), pygame.SRCALPHA))
+        pygame.draw.rect(gradient, (255, 255, 255, 30), gradient.get_rect(), border_radius=12)
+    return gradient
+
+_TOOLTIP_CACHE: Dict[str, pygame.Surface] = {}
+
+def get_tooltip(description: str) -> pygame.Surface:
+    """Return the rounded tooltip for a (possibly multi-line) description, built once."""
+    tooltip = _TOOLTIP_CACHE.get(description)
+    if tooltip is None:
+        desc_lines = description.split('\n')
+        desc_surfaces = [render_text(line, 24, BLACK) for line in desc_lines]
+        
+        # Calculate tooltip dimensions
+        max_width = max(surface.get_width() for surface in desc_surfaces)
+        total_height = sum(surface.get_height() for surface in desc_surfaces)
+        
+        padding = 10
+        tooltip = _TOOLTIP_CACHE[description] = to_display_format(pygame.Surface(
+            (max_width + padding * 2, total_height + padding * 2 + (len(desc_lines) - 1) * 5),
+            pygame.SRCALPHA))
+        pygame.draw.rect(tooltip, (*WHITE, 230), tooltip.get_rect(), border_radius=8)
+        
+        # Draw each line
+        y_offset = padding
+        for surface in desc_surfaces:
+            tooltip.blit(surface, (padding, y_offset))
+            y_offset += surface.get_height() + 5
+    return tooltip
+
+def blit_batch(screen: pygame.Surface, blits: List[Tuple[pygame.Surface, Tuple[int, int]]]):
+    """Blit a list of (surface, position) pairs in a single call."""
+    if _HAS_FBLITS:
+        screen.fblits(blits)
+    else:
+        screen.blits(blits, doreturn=False)
+
+def sine_table(steps: int, amplitude: float, offset: float) -> Tuple[float, ...]:
+    """Sample offset + amplitude * sin(phase) over one period in the given number of steps."""
+    return tuple(offset + amplitude * math.sin(2 * math.pi * i / steps) for i in range(steps))
 
 class AnimatedButton:
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: Tuple[int, int, int]):
         self.original_rect = pygame.Rect(x, y, width, height)
         self.rect = self.original_rect.copy()
+        # Updated in place while the scale animates, instead of a new Rect every frame
+        self._scratch_rect = self.original_rect.copy()
         self.text = text
         self.color = color
+        self.hover_color = tuple(min(c + 20, 255) for c in color)
         self.hover = False
         self.scale = 1.0
         self.animation_progress = 0
         self.click_animation = 0
         
-    def draw(self, screen: pygame.Surface):
+        # The whole button is rasterized once per hover state; draw only scales and blits it
+        self._base_surface = self._render_body(False)
+        self._hover_surface = self._render_body(True)
+        # Scaled copies by (hover, width, height); the animations only pass through a few sizes
+        self._scaled_surfaces: Dict[Tuple[bool, int, int], pygame.Surface] = {}
+        # Hovered buttons settle at HOVER_SCALE, so have that size ready
+        self._scaled_body(True, HOVER_SCALE)
+        
+    def _render_body(self, hover: bool) -> pygame.Surface:
+        """Composite shadow, glow, body, gradient and text into one Surface."""
+        width, height = self.original_rect.size
+        # Room for the 2px hover glow on every side and the 3px drop shadow below
+        surface = to_display_format(pygame.Surface((width + 4, height + 5), pygame.SRCALPHA))
+        body_rect = pygame.Rect(2, 2, width, height)
+        
+        # Draw button with shadow and glow (the screen is opaque, so these were never translucent)
+        pygame.draw.rect(surface, BLACK, body_rect.move(0, 3), border_radius=12)
+        
+        if hover:
+            pygame.draw.rect(surface, self.color, body_rect.inflate(4, 4), border_radius=12)
+        
+        # Draw main button with gradient
+        color = self.hover_color if hover else self.color
+        pygame.draw.rect(surface, color, body_rect, border_radius=12)
+        
+        surface.blit(get_button_gradient(width, height), body_rect)
+        
+        # Draw text with shadow
+        shadow_surface = render_text(self.text, 32, TEXT_SHADOW_COLOR)
+        text_surface = render_text(self.text, 32, WHITE)
+        blit_batch(surface, [
+            (shadow_surface, shadow_surface.get_rect(center=(body_rect.centerx + 1, body_rect.centery + 1))),
+            (text_surface, text_surface.get_rect(center=body_rect.center))
+        ])
+        return surface
+        
+    def _scaled_body(self, hover: bool, scale: float) -> pygame.Surface:
+        body = self._hover_surface if hover else self._base_surface
+        size = (int(body.get_width() * scale), int(body.get_height() * scale))
+        key = (hover, *size)
+        scaled = self._scaled_surfaces.get(key)
+        if scaled is None:
+            # Scale the prerendered button instead of redrawing it at the new size
+            scaled = self._scaled_surfaces[key] = pygame.transform.smoothscale(body, size)
+        return scaled
+        
+    def blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Advance the hover/click animation and return this frame's blits."""
         target_scale = HOVER_SCALE if self.hover else 1.0
-        self.scale += (target_scale - self.scale) * ANIMATION_SPEED
+        delta = target_scale - self.scale
+        # Snap once the easing is visually done, so settled buttons hit the fast paths below
+        if abs(delta) < 1e-3:
+            self.scale = target_scale
+        else:
+            self.scale += delta * ANIMATION_SPEED
         
         if self.click_animation > 0:
             self.click_animation = max(0, self.click_animation - 0.1)
             self.scale = 1.0 - self.click_animation * 0.1
+            
+        if self.scale == 1.0:
+            self.rect = self.original_rect
+            body = self._hover_surface if self.hover else self._base_surface
+            return [(body, (self.original_rect.x - 2, self.original_rect.y - 2))]
         
         # Calculate scaled dimensions
         scaled_width = int(self.original_rect.width * self.scale)
@@ -74,108 +225,105 @@ class AnimatedButton:
         x = self.original_rect.centerx - scaled_width // 2
         y = self.original_rect.centery - scaled_height // 2
         
-        self.rect = pygame.Rect(x, y, scaled_width, scaled_height)
+        self._scratch_rect.update(x, y, scaled_width, scaled_height)
+        self.rect = self._scratch_rect
         
-        # Draw button with shadow and glow
-        shadow_rect = self.rect.copy()
-        shadow_rect.y += 3
-        pygame.draw.rect(screen, (*BLACK, 30), shadow_rect, border_radius=12)
+        body = self._scaled_body(self.hover, self.scale)
+        return [(body, (x - int(2 * self.scale), y - int(2 * self.scale)))]
         
-        if self.hover:
-            glow_rect = self.rect.copy()
-            glow_rect.inflate_ip(4, 4)
-            pygame.draw.rect(screen, (*self.color, 100), glow_rect, border_radius=12)
-        
-        # Draw main button with gradient
-        color = tuple(min(c + 20, 255) for c in self.color) if self.hover else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=12)
-        
-        gradient_rect = self.rect.copy()
-        gradient_rect.height = self.rect.height // 2
-        gradient = pygame.Surface((gradient_rect.width, gradient_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(gradient, (255, 255, 255, 30), gradient.get_rect(), border_radius=12)
-        screen.blit(gradient, gradient_rect)
+    def draw(self, screen: pygame.Surface):
+        blit_batch(screen, self.blits())
         
-        # Draw text with shadow and scale animation
-        font = pygame.font.Font(None, int(32 * self.scale))
-        shadow_surface = font.render(self.text, True, (*BLACK, 128))
-        shadow_rect = shadow_surface.get_rect(center=(self.rect.centerx + 1, self.rect.centery + 1))
-        screen.blit(shadow_surface, shadow_rect)
+    def update_hover(self, pos: Tuple[int, int]):
+        self.hover = self.rect.collidepoint(pos)
         
-        text_surface = font.render(self.text, True, WHITE)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+    def was_clicked(self) -> bool:
+        # Clicks land on whatever the last mouse motion hovered
+        if self.hover:
+            self.click_animation = 1.0
+            return True
+        return False
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEMOTION:
-            self.hover = self.rect.collidepoint(event.pos)
+            self.update_hover(event.pos)
             
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.hover:
-                self.click_animation = 1.0
-                return True
+            return self.was_clicked()
         return False
 
 class MenuButton(AnimatedButton):
+    # Hover pulse scale per frame, one period at the old 0.05 rad per frame
+    _PULSE_SCALES = sine_table(126, 0.02, 1.0)
+    
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: Tuple[int, int, int], icon: str = None):
         super().__init__(x, y, width, height, text, color)
         self.icon = icon
         self.pulse = 0
+        # Composited glow, body and labels by (hover, width, height, icon size, text size);
+        # the pulse only ever passes through a handful of integer sizes
+        self._menu_bodies: Dict[Tuple[bool, int, int, int, int], pygame.Surface] = {}
         
-    def draw(self, screen: pygame.Surface):
-        self.pulse = (self.pulse + 0.05) % (2 * math.pi)
-        pulse_scale = 1.0 + 0.02 * math.sin(self.pulse) if self.hover else 1.0
-        
-        # Calculate scaled dimensions with pulse effect
-        scaled_width = int(self.original_rect.width * self.scale * pulse_scale)
-        scaled_height = int(self.original_rect.height * self.scale * pulse_scale)
-        x = self.original_rect.centerx - scaled_width // 2
-        y = self.original_rect.centery - scaled_height // 2
-        
-        self.rect = pygame.Rect(x, y, scaled_width, scaled_height)
+    def _render_menu_body(self, hover: bool, width: int, height: int, icon_size: int, text_size: int) -> pygame.Surface:
+        """Composite glow, background, icon and text for one button size, with a 10px glow margin."""
+        surface = to_display_format(pygame.Surface((width + 20, height + 20), pygame.SRCALPHA))
+        body_rect = pygame.Rect(10, 10, width, height)
         
         # Draw glowing effect when hovered
-        if self.hover:
-            glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
+        if hover:
             for i in range(10):
                 alpha = 25 - i * 2
-                pygame.draw.rect(glow_surface, (*self.color, alpha),
-                               (i, i, scaled_width + 20 - 2*i, scaled_height + 20 - 2*i),
+                pygame.draw.rect(surface, (*self.color, alpha),
+                               (i, i, width + 20 - 2*i, height + 20 - 2*i),
                                border_radius=15)
-            screen.blit(glow_surface, (x - 10, y - 10))
         
         # Draw button background with gradient
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=12)
-        gradient_rect = self.rect.copy()
-        gradient_rect.height = self.rect.height // 2
-        gradient = pygame.Surface((gradient_rect.width, gradient_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(gradient, (255, 255, 255, 30), gradient.get_rect(), border_radius=12)
-        screen.blit(gradient, gradient_rect)
+        pygame.draw.rect(surface, self.color, body_rect, border_radius=12)
+        surface.blit(get_button_gradient(width, height), body_rect)
         
         # Draw icon if provided
         if self.icon:
-            icon_font = pygame.font.Font(None, int(36 * self.scale * pulse_scale))
-            icon_surface = icon_font.render(self.icon, True, WHITE)
+            icon_surface = render_text(self.icon, icon_size, WHITE)
             icon_rect = icon_surface.get_rect(
-                centery=self.rect.centery,
-                x=self.rect.x + 20
+                centery=body_rect.centery,
+                x=body_rect.x + 20
             )
-            screen.blit(icon_surface, icon_rect)
+            surface.blit(icon_surface, icon_rect)
             
             # Draw text with offset for icon
-            font = pygame.font.Font(None, int(32 * self.scale * pulse_scale))
-            text_surface = font.render(self.text, True, WHITE)
+            text_surface = render_text(self.text, text_size, WHITE)
             text_rect = text_surface.get_rect(
-                centery=self.rect.centery,
+                centery=body_rect.centery,
                 x=icon_rect.right + 10
             )
-            screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
         else:
             # Draw centered text
-            font = pygame.font.Font(None, int(32 * self.scale * pulse_scale))
-            text_surface = font.render(self.text, True, WHITE)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            screen.blit(text_surface, text_rect)
+            text_surface = render_text(self.text, text_size, WHITE)
+            text_rect = text_surface.get_rect(center=body_rect.center)
+            surface.blit(text_surface, text_rect)
+        return surface
+        
+    def blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Advance the hover pulse and return this frame's blits."""
+        self.pulse = (self.pulse + 1) % len(self._PULSE_SCALES)
+        pulse_scale = self._PULSE_SCALES[self.pulse] if self.hover else 1.0
+        
+        # Calculate scaled dimensions with pulse effect
+        scaled_width = int(self.original_rect.width * self.scale * pulse_scale)
+        scaled_height = int(self.original_rect.height * self.scale * pulse_scale)
+        x = self.original_rect.centerx - scaled_width // 2
+        y = self.original_rect.centery - scaled_height // 2
+        
+        self._scratch_rect.update(x, y, scaled_width, scaled_height)
+        self.rect = self._scratch_rect
+        
+        key = (self.hover, scaled_width, scaled_height,
+               int(36 * self.scale * pulse_scale), int(32 * self.scale * pulse_scale))
+        body = self._menu_bodies.get(key)
+        if body is None:
+            body = self._menu_bodies[key] = self._render_menu_body(*key)
+        return [(body, (x - 10, y - 10))]
 
 class DifficultyButton(AnimatedButton):
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: Tuple[int, int, int], description: str):
@@ -187,14 +335,7 @@ class DifficultyButton(AnimatedButton):
         
         if self.hover or selected:
             # Draw description tooltip
-            font = pygame.font.Font(None, 24)
-            desc_surface = font.render(self.description, True, BLACK)
-            padding = 10
-            tooltip = pygame.Surface((desc_surface.get_width() + padding * 2, 
-                                    desc_surface.get_height() + padding * 2), 
-                                   pygame.SRCALPHA)
-            pygame.draw.rect(tooltip, (*WHITE, 230), tooltip.get_rect(), border_radius=8)
-            tooltip.blit(desc_surface, (padding, padding))
+            tooltip = get_tooltip(self.description)
             
             # Position tooltip above button
             tooltip_x = self.rect.centerx - tooltip.get_width() // 2
@@ -224,25 +365,7 @@ class AlgorithmButton(AnimatedButton):
         
         if self.hover or selected:
             # Draw description tooltip
-            font = pygame.font.Font(None, 24)
-            desc_lines = self.description.split('\n')
-            desc_surfaces = [font.render(line, True, BLACK) for line in desc_lines]
-            
-            # Calculate tooltip dimensions
-            max_width = max(surface.get_width() for surface in desc_surfaces)
-            total_height = sum(surface.get_height() for surface in desc_surfaces)
-            
-            padding = 10
-            tooltip = pygame.Surface((max_width + padding * 2, 
-                                    total_height + padding * 2 + (len(desc_lines) - 1) * 5), 
-                                   pygame.SRCALPHA)
-            pygame.draw.rect(tooltip, (*WHITE, 230), tooltip.get_rect(), border_radius=8)
-            
-            # Draw each line
-            y_offset = padding
-            for surface in desc_surfaces:
-                tooltip.blit(surface, (padding, y_offset))
-                y_offset += surface.get_height() + 5
+            tooltip = get_tooltip(self.description)
             
             # Position tooltip above button
             tooltip_x = self.rect.centerx - tooltip.get_width() // 2
@@ -253,16 +376,28 @@ class AlgorithmButton(AnimatedButton):
                 # Draw selection indicator
                 pygame.draw.rect(screen, SUCCESS_COLOR, self.rect, 3, border_radius=12)
 
+# Input border colour for every step of the focus animation, from GRAY to PRIMARY_COLOR
+_BORDER_STEPS = round(1 / ANIMATION_SPEED)
+_BORDER_COLORS = tuple(
+    tuple(int(a + (b - a) * i / _BORDER_STEPS) for a, b in zip(GRAY, PRIMARY_COLOR))
+    for i in range(_BORDER_STEPS + 1)
+)
+
 class ModernInputBox:
     def __init__(self, x: int, y: int, width: int, height: int, max_length: int = 6, placeholder: str = "Type a word..."):
         self.rect = pygame.Rect(x, y, width, height)
+        # The shaken box position, reused every frame
+        self._box_rect = self.rect.copy()
+        # The last drawn box and the (border colour, text, cursor) it shows
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_key = None
         self.text = ''
         self.active = False
         self.animation_progress = 0
         self.error = False
         self.error_shake = 0
+        self._error_ticks = 0  # When the last error shake started
         self.cursor_visible = True
-        self.cursor_timer = 0
         self.max_length = max_length
         self.placeholder = placeholder
         
@@ -281,29 +416,30 @@ class ModernInputBox:
                     return text
             elif event.key == pygame.K_BACKSPACE:
                 self.text = self.text[:-1]
-            elif event.unicode in string.ascii_letters and len(self.text) < self.max_length:
+            elif (len(event.unicode) == 1 and event.unicode in _ASCII_LETTERS and 
+                  len(self.text) < self.max_length):
                 self.text += event.unicode
         return None
         
     def show_error(self):
         self.error = True
         self.error_shake = 1.0
+        self._error_ticks = pygame.time.get_ticks()
         
     def draw(self, screen: pygame.Surface):
-        # Update animations
+        # Update animations from the clock, so they keep their pace when frames are skipped
+        ticks = pygame.time.get_ticks()
         if self.error_shake > 0:
-            self.error_shake = max(0, self.error_shake - 0.1)
+            self.error_shake = max(0, 1.0 - (ticks - self._error_ticks) / ERROR_SHAKE_MS)
             
-        self.cursor_timer = (self.cursor_timer + 1) % 30
-        self.cursor_visible = self.cursor_timer < 15
+        self.cursor_visible = ticks % CURSOR_BLINK_MS < CURSOR_BLINK_MS // 2
         
         # Calculate shake offset
         shake_offset = math.sin(self.error_shake * 10) * 5 * self.error_shake
         
-        # Draw input box background with error state
-        box_rect = self.rect.copy()
+        box_rect = self._box_rect
+        box_rect.update(self.rect)
         box_rect.x += shake_offset
-        pygame.draw.rect(screen, LIGHT_GRAY, box_rect, border_radius=12)
         
         # Animated border
         if self.active:
@@ -311,32 +447,54 @@ class ModernInputBox:
         else:
             self.animation_progress = max(0, self.animation_progress - ANIMATION_SPEED)
             
-        border_color = ERROR_COLOR if self.error else tuple(
-            int(a + (b - a) * self.animation_progress) 
-            for a, b in zip(GRAY, PRIMARY_COLOR)
-        )
-        pygame.draw.rect(screen, border_color, box_rect, 2, border_radius=12)
+        if self.error:
+            border_color = ERROR_COLOR
+        else:
+            border_color = _BORDER_COLORS[round(self.animation_progress * _BORDER_STEPS)]
+            
+        # The box only needs redrawing when its colour, text or cursor changes
+        key = (border_color, self.text, bool(self.text) and self.active and self.cursor_visible)
+        if key != self._surface_key:
+            self._surface = self._render_box(*key)
+            self._surface_key = key
+        screen.blit(self._surface, box_rect)
+        
+    def _render_box(self, border_color: Tuple[int, int, int], text: str, show_cursor: bool) -> pygame.Surface:
+        """Draw the box background, border, text and cursor onto a Surface of the box's size."""
+        surface = to_display_format(pygame.Surface(self.rect.size, pygame.SRCALPHA))
+        box_rect = surface.get_rect()
+        
+        # Draw input box background with error state
+        pygame.draw.rect(surface, LIGHT_GRAY, box_rect, border_radius=12)
+        pygame.draw.rect(surface, border_color, box_rect, 2, border_radius=12)
         
         # Draw text with cursor
-        font = pygame.font.Font(None, 32)
-        if self.text:
-            text_surface = font.render(self.text, True, BLACK)
+        if text:
+            text_surface = render_text(text, 32, BLACK)
             text_rect = text_surface.get_rect(center=box_rect.center)
-            screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
             
             # Draw cursor
-            if self.active and self.cursor_visible:
+            if show_cursor:
                 cursor_x = text_rect.right + 2
                 cursor_height = text_surface.get_height()
-                pygame.draw.line(screen, BLACK,
+                pygame.draw.line(surface, BLACK,
                                (cursor_x, box_rect.centery - cursor_height//2),
                                (cursor_x, box_rect.centery + cursor_height//2), 2)
         else:
-            text_surface = font.render(self.placeholder, True, GRAY)
+            text_surface = render_text(self.placeholder, 32, GRAY)
             text_rect = text_surface.get_rect(center=box_rect.center)
-            screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
+        return surface
 
 class GraphNode:
+    # Current-node pulse scale per frame, one period at the old 0.1 rad per frame
+    _PULSE_SCALES = sine_table(63, 0.1, 1.0)
+    # Glow and highlight sprites are identical for every node, so they are shared per radius
+    _glow_cache: Dict[Tuple[int, Tuple[int, int, int]], pygame.Surface] = {}
+    _body_cache: Dict[Tuple[int, Tuple[int, int, int]], pygame.Surface] = {}
+    _label_cache: Dict[Tuple[str, int], pygame.Surface] = {}
+    
     def __init__(self, word: str, x: float, y: float):
         self.word = word
         self.x = x
@@ -347,79 +505,121 @@ class GraphNode:
         self.hover = False
         self.pulse = 0
         self.label = None
+        # Text positions, updated in place since they are recomputed every frame
+        self._shadow_rect = pygame.Rect(0, 0, 0, 0)
+        self._text_rect = pygame.Rect(0, 0, 0, 0)
         
     def update(self):
         self.x += (self.target_x - self.x) * 0.1
         self.y += (self.target_y - self.y) * 0.1
         target_scale = HOVER_SCALE if self.hover else 1.0
         self.scale += (target_scale - self.scale) * ANIMATION_SPEED
-        self.pulse = (self.pulse + 0.1) % (2 * math.pi)
+        self.pulse = (self.pulse + 1) % len(self._PULSE_SCALES)
+        
+    @classmethod
+    def _glow_surface(cls, glow_radius: int, glow_color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (glow_radius, glow_color)
+        glow_surface = cls._glow_cache.get(key)
+        if glow_surface is None:
+            glow_surface = cls._glow_cache[key] = to_display_format(
+                pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA))
+            for r in range(5):
+                alpha = 50 - r * 10
+                pygame.draw.circle(glow_surface, (*glow_color, alpha), 
+                                (glow_radius, glow_radius), glow_radius - r)
+        return glow_surface
+    
+    @classmethod
+    def _body_surface(cls, radius: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Composite drop shadow, node circle and highlight for one radius and colour."""
+        key = (radius, color)
+        body = cls._body_cache.get(key)
+        if body is None:
+            body = cls._body_cache[key] = to_display_format(
+                pygame.Surface((radius * 2 + 1, radius * 2 + 4), pygame.SRCALPHA))
+            # Draw shadow (the screen is opaque, so it was never translucent)
+            pygame.draw.circle(body, BLACK, (radius, radius + 3), radius)
+            pygame.draw.circle(body, color, (radius, radius), radius)
+            
+            # Draw highlight effect
+            highlight = pygame.Surface((radius * 2, radius), pygame.SRCALPHA)
+            pygame.draw.ellipse(highlight, (255, 255, 255, 30), highlight.get_rect())
+            body.blit(highlight, (0, 0))
+        return body
+        
+    @classmethod
+    def _label_surface(cls, label: str, size: int) -> pygame.Surface:
+        """Render a step label on its rounded background, once per label and font size."""
+        key = (label, size)
+        label_bg = cls._label_cache.get(key)
+        if label_bg is None:
+            label_surface = render_text(label, size, BLACK)
+            label_bg = cls._label_cache[key] = to_display_format(
+                pygame.Surface((label_surface.get_width() + 10, label_surface.get_height() + 6), pygame.SRCALPHA))
+            pygame.draw.rect(label_bg, (255, 255, 255, 200), label_bg.get_rect(), border_radius=8)
+            label_bg.blit(label_surface, (5, 3))
+        return label_bg
         
-    def draw(self, screen: pygame.Surface, is_current: bool, is_target: bool, is_optimal_path: bool = False):
+    def blits(self, is_current: bool, is_target: bool, is_optimal_path: bool = False) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return this node's glow, body and text (surface, position) pairs in draw order."""
         # Calculate scaled dimensions
-        pulse_scale = 1.0 + 0.1 * math.sin(self.pulse) if is_current else 1.0
+        pulse_scale = self._PULSE_SCALES[self.pulse] if is_current else 1.0
         scaled_radius = int(NODE_RADIUS * self.scale * pulse_scale)
+        x, y = int(self.x), int(self.y)
         
-        # Draw glow effect for current/target nodes
+        # Glow effect for current/target nodes
+        blits = []
         if is_current or is_target:
             glow_radius = scaled_radius + 10
             glow_color = SUCCESS_COLOR if is_target else PRIMARY_COLOR
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            for r in range(5):
-                alpha = 50 - r * 10
-                pygame.draw.circle(glow_surface, (*glow_color, alpha), 
-                                (glow_radius, glow_radius), glow_radius - r)
-            screen.blit(glow_surface, 
-                       (self.x - glow_radius, self.y - glow_radius))
+            blits.append((self._glow_surface(glow_radius, glow_color), (x - glow_radius, y - glow_radius)))
         
-        # Draw shadow
-        shadow_pos = (int(self.x), int(self.y + 3))
-        pygame.draw.circle(screen, (*BLACK, 30), shadow_pos, scaled_radius)
-        
-        # Draw node
+        # Node body
         color = SUCCESS_COLOR if is_target else PRIMARY_COLOR if is_current else SECONDARY_COLOR
         if is_optimal_path and not (is_current or is_target):
             # Highlight nodes in the optimal path
             color = (255, 193, 7)  # Amber color for optimal path
-            
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), scaled_radius)
-        
-        # Draw highlight effect
-        highlight = pygame.Surface((scaled_radius * 2, scaled_radius), pygame.SRCALPHA)
-        pygame.draw.ellipse(highlight, (255, 255, 255, 30), highlight.get_rect())
-        screen.blit(highlight, (self.x - scaled_radius, self.y - scaled_radius))
-        
-        # Draw text with shadow
-        font = pygame.font.Font(None, int(24 * self.scale * pulse_scale))
-        shadow_text = font.render(self.word, True, (*BLACK, 128))
-        text = font.render(self.word, True, WHITE)
-        
-        shadow_rect = shadow_text.get_rect(center=(self.x + 1, self.y + 1))
-        text_rect = text.get_rect(center=(self.x, self.y))
-        
-        screen.blit(shadow_text, shadow_rect)
-        screen.blit(text, text_rect)
-        
-        # Draw label if exists
+        blits.append((self._body_surface(scaled_radius, color), (x - scaled_radius, y - scaled_radius)))
+        
+        # Text with shadow; the pulsing size is an int, so renders are cached per size
+        font_size = int(24 * self.scale * pulse_scale)
+        shadow_text = render_text(self.word, font_size, TEXT_SHADOW_COLOR)
+        text = render_text(self.word, font_size, WHITE)
+        self._shadow_rect.size = shadow_text.get_size()
+        self._shadow_rect.center = (self.x + 1, self.y + 1)
+        self._text_rect.size = text.get_size()
+        self._text_rect.center = (self.x, self.y)
+        blits.append((shadow_text, self._shadow_rect))
+        blits.append((text, self._text_rect))
+        
+        # Label if exists
         if self.label:
-            label_font = pygame.font.Font(None, int(18 * self.scale))
-            label_surface = label_font.render(self.label, True, BLACK)
-            label_bg = pygame.Surface((label_surface.get_width() + 10, label_surface.get_height() + 6), pygame.SRCALPHA)
-            pygame.draw.rect(label_bg, (255, 255, 255, 200), label_bg.get_rect(), border_radius=8)
-            label_bg.blit(label_surface, (5, 3))
+            label_bg = self._label_surface(self.label, int(18 * self.scale))
             
             # Position label above node
             label_x = self.x - label_bg.get_width() // 2
             label_y = self.y - scaled_radius - label_bg.get_height() - 5
-            screen.blit(label_bg, (label_x, label_y))
+            blits.append((label_bg, (label_x, label_y)))
+        return blits
 
 class WordGraph:
     def __init__(self):
         self.nodes: Dict[str, GraphNode] = {}
         self.edges: List[Tuple[str, str]] = []
         self.optimal_path: List[str] = []
+        # Membership sets for the optimal path, so draw does O(1) lookups per edge and node
+        self.optimal_edges: Set[Tuple[str, str]] = set()
+        self.optimal_words: Set[str] = set()
+        # The path and optimal path the layout was last built from
+        self._layout_key = None
         
     def update_layout(self, path: List[str], optimal_path: List[str] = None):
+        # Called every frame, but the layout only changes when a path does
+        layout_key = (tuple(path), tuple(optimal_path or ()))
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
+        
         # Create nodes for each word in the path
         num_nodes = len(path)
         for i, word in enumerate(path):
@@ -438,6 +638,8 @@ class WordGraph:
         
         # Store optimal path if provided
         self.optimal_path = optimal_path or []
+        self.optimal_edges = set(zip(self.optimal_path[:-1], self.optimal_path[1:]))
+        self.optimal_words = set(self.optimal_path)
         
         # Add labels to nodes in optimal path
         if optimal_path:
@@ -446,40 +648,27 @@ class WordGraph:
                     self.nodes[word].label = f"Step {i+1}"
         
     def draw(self, screen: pygame.Surface, current_word: str, target_word: str):
-        # Draw edges with animated gradient effect
+        # Draw edges as solid lines, amber along the optimal path
         for start_word, end_word in self.edges:
             start_node = self.nodes[start_word]
             end_node = self.nodes[end_word]
             
             # Determine if this edge is part of the optimal path
-            is_optimal_edge = False
-            if self.optimal_path and len(self.optimal_path) > 1:
-                for i in range(len(self.optimal_path) - 1):
-                    if (self.optimal_path[i] == start_word and 
-                        self.optimal_path[i+1] == end_word):
-                        is_optimal_edge = True
-                        break
-            
-            # Create animated gradient line
-            steps = 15
-            t_offset = (pygame.time.get_ticks() % 1000) / 1000.0
+            is_optimal_edge = (start_word, end_word) in self.optimal_edges
             
-            for i in range(steps):
-                t = (i / (steps - 1) + t_offset) % 1.0
-                x1 = start_node.x + (end_node.x - start_node.x) * t
-                y1 = start_node.y + (end_node.y - start_node.y) * t
-                x2 = start_node.x + (end_node.x - start_node.x) * ((t + 0.1) % 1.0)
-                y2 = start_node.y + (end_node.y - start_node.y) * ((t + 0.1) % 1.0)
-                
-                alpha = int(255 * (1 - abs(t - 0.5) * 2))
-                edge_color = (255, 193, 7) if is_optimal_edge else PRIMARY_COLOR  # Amber for optimal path
-                pygame.draw.line(screen, (*edge_color, alpha), (x1, y1), (x2, y2), 3)
-        
-        # Draw nodes
+            # The display surface has no per-pixel alpha, so the old faded segments always
+            # covered the edge as one solid line; draw that line in a single call
+            edge_color = (255, 193, 7) if is_optimal_edge else PRIMARY_COLOR  # Amber for optimal path
+            pygame.draw.line(screen, edge_color, (start_node.x, start_node.y), (end_node.x, end_node.y), 3)
+        
+        # Draw nodes in one batched blit, still node by node so overlapping
+        # neighbours stack exactly as when each node was drawn on its own
+        node_blits = []
         for word, node in self.nodes.items():
             node.update()
-            is_in_optimal = word in self.optimal_path
-            node.draw(screen, word == current_word, word == target_word, is_in_optimal)
+            is_in_optimal = word in self.optimal_words
+            node_blits += node.blits(word == current_word, word == target_word, is_in_optimal)
+        blit_batch(screen, node_blits)
 
 class CustomGameMenu:
     def __init__(self, game: WordLadderGame):
@@ -526,27 +715,22 @@ class CustomGameMenu:
         self.message = ""
         self.message_color = BLACK
         self.message_animation = 0
+        self._message_surface: Optional[pygame.Surface] = None
         
-    def draw(self, screen: pygame.Surface):
-        # Draw title
-        font_title = pygame.font.Font(None, 64)
-        title = font_title.render("Custom Word Ladder", True, PRIMARY_COLOR)
+        # Title, subtitle and input labels never move, so they are laid out once
+        title = render_text("Custom Word Ladder", 64, PRIMARY_COLOR)
         title_rect = title.get_rect(centerx=WINDOW_WIDTH//2, y=100)
-        screen.blit(title, title_rect)
-        
-        # Draw subtitle
-        font_subtitle = pygame.font.Font(None, 32)
-        subtitle = font_subtitle.render("Enter two words of the same length", True, SECONDARY_COLOR)
-        subtitle_rect = subtitle.get_rect(centerx=WINDOW_WIDTH//2, y=title_rect.bottom + 20)
-        screen.blit(subtitle, subtitle_rect)
-        
-        # Draw input labels
-        font_label = pygame.font.Font(None, 28)
-        start_label = font_label.render("Start Word:", True, BLACK)
-        target_label = font_label.render("Target Word:", True, BLACK)
+        subtitle = render_text("Enter two words of the same length", 32, SECONDARY_COLOR)
+        self._static_blits = [
+            (title, title_rect),
+            (subtitle, subtitle.get_rect(centerx=WINDOW_WIDTH//2, y=title_rect.bottom + 20)),
+            (render_text("Start Word:", 28, BLACK), (self.start_input.rect.x, self.start_input.rect.y - 30)),
+            (render_text("Target Word:", 28, BLACK), (self.target_input.rect.x, self.target_input.rect.y - 30))
+        ]
         
-        screen.blit(start_label, (self.start_input.rect.x, self.start_input.rect.y - 30))
-        screen.blit(target_label, (self.target_input.rect.x, self.target_input.rect.y - 30))
+    def draw(self, screen: pygame.Surface):
+        # Draw title, subtitle and input labels
+        blit_batch(screen, self._static_blits)
         
         # Draw input boxes and buttons
         self.start_input.draw(screen)
@@ -558,7 +742,7 @@ class CustomGameMenu:
         if self.message:
             if self.message_animation < 1:
                 self.message_animation = min(1, self.message_animation + 0.05)
-            message_surface = font_subtitle.render(self.message, True, self.message_color)
+            message_surface = self._message_surface
             message_surface.set_alpha(int(255 * self.message_animation))
             message_rect = message_surface.get_rect(
                 centerx=WINDOW_WIDTH//2,
@@ -570,15 +754,34 @@ class CustomGameMenu:
         self.message = text
         self.message_color = color
         self.message_animation = 0
+        # Rendered once here; draw only changes its alpha while it fades in
+        self._message_surface = to_display_format(get_font(32).render(text, True, color))
         
     def handle_event(self, event: pygame.event.Event) -> Tuple[Optional[str], Optional[Tuple[str, str]]]:
+        # Check the event type once and only hand each widget the events it reacts to
+        if event.type == pygame.MOUSEMOTION:
+            self.back_button.update_hover(event.pos)
+            self.start_button.update_hover(event.pos)
+            return None, None
+            
+        if event.type == pygame.KEYDOWN:
+            # Only the focused box takes typing
+            if self.start_input.active:
+                self.start_input.handle_event(event)
+            elif self.target_input.active:
+                self.target_input.handle_event(event)
+            return None, None
+            
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return None, None
+            
         self.start_input.handle_event(event)
         self.target_input.handle_event(event)
         
-        if self.back_button.handle_event(event):
+        if self.back_button.was_clicked():
             return MENU_STATE_MAIN, None
             
-        if self.start_button.handle_event(event):
+        if self.start_button.was_clicked():
             start_word = self.start_input.text.lower()
             target_word = self.target_input.text.lower()
             
@@ -648,12 +851,12 @@ class AlgorithmMenu:
             )
         }
         
+        title = render_text("Select Hint Algorithm", 64, PRIMARY_COLOR)
+        self._title_blit = (title, title.get_rect(centerx=WINDOW_WIDTH//2, y=100))
+        
     def draw(self, screen: pygame.Surface):
         # Draw title
-        font_title = pygame.font.Font(None, 64)
-        title = font_title.render("Select Hint Algorithm", True, PRIMARY_COLOR)
-        title_rect = title.get_rect(centerx=WINDOW_WIDTH//2, y=100)
-        screen.blit(title, title_rect)
+        screen.blit(*self._title_blit)
         
         # Draw buttons
         for alg, button in self.algorithm_buttons.items():
@@ -662,17 +865,28 @@ class AlgorithmMenu:
         self.back_button.draw(screen)
         
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
-        if self.back_button.handle_event(event):
-            return MENU_STATE_GAME
-            
-        for alg, button in self.algorithm_buttons.items():
-            if button.handle_event(event):
-                self.game.set_hint_algorithm(alg)
+        if event.type == pygame.MOUSEMOTION:
+            self.back_button.update_hover(event.pos)
+            for button in self.algorithm_buttons.values():
+                button.update_hover(event.pos)
+                
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.back_button.was_clicked():
                 return MENU_STATE_GAME
                 
+            for alg, button in self.algorithm_buttons.items():
+                if button.was_clicked():
+                    self.game.set_hint_algorithm(alg)
+                    return MENU_STATE_GAME
+                
         return None
 
 class MainMenu:
+    # Particle size and alpha per frame, one period at the old 0.05 rad per frame; particle i
+    # runs 2 steps (0.1 rad) ahead in size and 4 steps (0.2 rad) ahead in alpha of particle i-1
+    _PARTICLE_SIZES = sine_table(126, 2, 3)
+    _PARTICLE_ALPHAS = tuple(int(alpha) for alpha in sine_table(126, 64, 128))
+    
     def __init__(self):
         center_x = WINDOW_WIDTH // 2
         button_spacing = 80
@@ -718,45 +932,72 @@ class MainMenu:
         }
         
         self.title_animation = 0
-        self.particles = [(random.random() * WINDOW_WIDTH,
-                          random.random() * WINDOW_HEIGHT,
-                          random.random() * 2 * math.pi) for _ in range(50)]
+        # One full period of the title pulse, rendered up front; each frame also has the
+        # subtitle position below that title size
+        subtitle = render_text("An Elegant Word Game", 36, SECONDARY_COLOR)
+        self._title_frames = []
+        for i in range(TITLE_PULSE_FRAMES):
+            title = render_text("Word Ladder", 
+                                int(100 * (1 + 0.05 * math.sin(2 * math.pi * i / TITLE_PULSE_FRAMES))), 
+                                PRIMARY_COLOR)
+            title_rect = title.get_rect(centerx=WINDOW_WIDTH//2, y=150)
+            subtitle_rect = subtitle.get_rect(centerx=WINDOW_WIDTH//2, y=title_rect.bottom + 20)
+            self._title_frames.append(((title, title_rect), (subtitle, subtitle_rect)))
+        # Particles drift in a fixed direction, so each keeps its per-frame step (dx, dy)
+        self.particles = []
+        for _ in range(50):
+            x, y = random.random() * WINDOW_WIDTH, random.random() * WINDOW_HEIGHT
+            angle = random.random() * 2 * math.pi
+            self.particles.append((x, y, math.cos(angle) * 0.5, math.sin(angle) * 0.5))
+        self._particle_phase = 0
+        # Particle sprites by (surface size, radius, alpha), drawn on first use
+        self._particle_surfaces: Dict[Tuple[int, int, int], pygame.Surface] = {}
         
     def draw(self, screen: pygame.Surface):
         # Draw animated background particles
-        for i, (x, y, angle) in enumerate(self.particles):
-            size = 3 + 2 * math.sin(self.title_animation + i * 0.1)
-            alpha = int(128 + 64 * math.sin(self.title_animation + i * 0.2))
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (*PRIMARY_COLOR, alpha), (size, size), size)
-            screen.blit(particle_surface, (x, y))
+        sizes, alphas = self._PARTICLE_SIZES, self._PARTICLE_ALPHAS
+        steps = len(sizes)
+        phase = self._particle_phase
+        self._particle_phase = (phase + 1) % steps
+        particle_surfaces = self._particle_surfaces
+        particle_blits = []
+        for i, (x, y, dx, dy) in enumerate(self.particles):
+            size = sizes[(phase + 2 * i) % steps]
+            alpha = alphas[(phase + 4 * i) % steps]
+            # The surface and circle only depend on the truncated size, so this key is exact
+            key = (int(size * 2), int(size), alpha)
+            particle_surface = particle_surfaces.get(key)
+            if particle_surface is None:
+                particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(particle_surface, (*PRIMARY_COLOR, alpha), (size, size), size)
+                particle_surface = particle_surfaces[key] = to_display_format(particle_surface)
+            particle_blits.append((particle_surface, (x, y)))
             
             # Update particle position
-            self.particles[i] = ((x + math.cos(angle) * 0.5) % WINDOW_WIDTH,
-                               (y + math.sin(angle) * 0.5) % WINDOW_HEIGHT,
-                               angle)
+            self.particles[i] = ((x + dx) % WINDOW_WIDTH, (y + dy) % WINDOW_HEIGHT, dx, dy)
+        blit_batch(screen, particle_blits)
         
         # Draw animated title
         self.title_animation += 0.05
-        title_scale = 1 + 0.05 * math.sin(self.title_animation)
-        font_title = pygame.font.Font(None, int(100 * title_scale))
-        title = font_title.render("Word Ladder", True, PRIMARY_COLOR)
-        title_rect = title.get_rect(centerx=WINDOW_WIDTH//2, y=150)
-        screen.blit(title, title_rect)
-        
-        # Draw subtitle
-        font_subtitle = pygame.font.Font(None, 36)
-        subtitle = font_subtitle.render("An Elegant Word Game", True, SECONDARY_COLOR)
-        subtitle_rect = subtitle.get_rect(centerx=WINDOW_WIDTH//2, y=title_rect.bottom + 20)
-        screen.blit(subtitle, subtitle_rect)
+        frame = int(self.title_animation * TITLE_PULSE_FRAMES / (2 * math.pi)) % TITLE_PULSE_FRAMES
         
-        # Draw buttons
+        # Title, subtitle and buttons go out in one batch
+        text_and_buttons = list(self._title_frames[frame])
         for button in self.buttons.values():
-            button.draw(screen)
+            text_and_buttons.extend(button.blits())
+        blit_batch(screen, text_and_buttons)
             
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
+        if event.type == pygame.MOUSEMOTION:
+            for button in self.buttons.values():
+                button.update_hover(event.pos)
+            return None
+            
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return None
+            
         for name, button in self.buttons.items():
-            if button.handle_event(event):
+            if button.was_clicked():
                 if name == 'play':
                     return MENU_STATE_GAME
                 elif name == 'custom':
@@ -791,43 +1032,56 @@ class HelpMenu:
             ("Custom Games", "Create your own word ladder by entering:\n• A starting word\n• A target word of the same length\nThe game will verify if a valid path exists."),
             ("Scoring", "• Points are awarded based on remaining moves\n• Bonus points for completing in fewer moves\n• Try to beat your high score!")
         ]
-        
-    def draw(self, screen: pygame.Surface):
-        # Smooth scrolling
-        self.scroll_offset += (self.target_scroll - self.scroll_offset) * 0.1
-        
-        # Draw help content
-        content_surface = pygame.Surface((WINDOW_WIDTH - 2*PADDING, WINDOW_HEIGHT - 2*PADDING), pygame.SRCALPHA)
-        y_offset = -int(self.scroll_offset)
+        # Sections never change, so only the scrolled window into them is blitted per frame
+        self.content_surface = self._render_content()
+        self._content_area = pygame.Rect(0, 0, WINDOW_WIDTH - 2*PADDING, WINDOW_HEIGHT - 2*PADDING)
+        self._content_pos = (PADDING, PADDING + BUTTON_HEIGHT + PADDING)
+        # Everything the back button can cover while it grows, pulses and glows on hover
+        self._button_area = self.back_button.original_rect.inflate(40, 40)
+        
+    def _render_content(self) -> pygame.Surface:
+        """Lay out every help section once on a surface tall enough to hold them all."""
+        height = sum(100 + 40 * len(text.split('\n')) for _, text in self.rules)
+        content_surface = to_display_format(pygame.Surface((WINDOW_WIDTH - 2*PADDING, height), pygame.SRCALPHA))
+        y_offset = 0
         
         for title, text in self.rules:
             # Draw section title
-            font_title = pygame.font.Font(None, 48)
-            title_surface = font_title.render(title, True, PRIMARY_COLOR)
-            title_rect = title_surface.get_rect(x=0, y=y_offset)
-            content_surface.blit(title_surface, title_rect)
+            content_surface.blit(render_text(title, 48, PRIMARY_COLOR), (0, y_offset))
             
             # Draw section content
-            font_content = pygame.font.Font(None, 32)
             y_offset += 60
             for line in text.split('\n'):
-                text_surface = font_content.render(line, True, BLACK)
-                text_rect = text_surface.get_rect(x=20, y=y_offset)
-                content_surface.blit(text_surface, text_rect)
+                content_surface.blit(render_text(line, 32, BLACK), (20, y_offset))
                 y_offset += 40
             
             y_offset += 40
         
-        screen.blit(content_surface, (PADDING, PADDING + BUTTON_HEIGHT + PADDING))
+        return content_surface
+        
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Draw the help screen and return the areas that may differ from the last frame."""
+        # Smooth scrolling
+        self.scroll_offset += (self.target_scroll - self.scroll_offset) * 0.1
+        
+        # Draw the visible slice of the prerendered help content
+        scrolled = self._content_area.y != int(self.scroll_offset)
+        self._content_area.y = int(self.scroll_offset)
+        content_rect = screen.blit(self.content_surface, self._content_pos, self._content_area)
         
         # Draw back button
         self.back_button.draw(screen)
         
+        if scrolled:
+            return [content_rect, self._button_area]
+        return [self._button_area]
+        
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         if event.type == pygame.MOUSEWHEEL:
             self.target_scroll = max(0, min(self.target_scroll - event.y * 30, 400))
-        
-        if self.back_button.handle_event(event):
+        elif event.type == pygame.MOUSEMOTION:
+            self.back_button.update_hover(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and self.back_button.was_clicked():
             return MENU_STATE_MAIN
         return None
 
@@ -835,6 +1089,12 @@ class WordLadderGUI:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Word Ladder - An Elegant Word Game")
+        # Only queue the event types the UI handles; TEXTINPUT feeds KEYDOWN's unicode and
+        # WINDOWEXPOSED forces the next frame to be presented in full
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, 
+                                  pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.TEXTINPUT,
+                                  pygame.WINDOWEXPOSED])
         
         self.game = WordLadderGame()
         self.game_state = None
@@ -845,6 +1105,13 @@ class WordLadderGUI:
         self.help_menu = HelpMenu()
         self.custom_menu = CustomGameMenu(self.game)
         self.algorithm_menu = AlgorithmMenu(self.game)
+        # Menu screens draw themselves; only the help screen reports its changed areas
+        self._menu_draws = {
+            MENU_STATE_MAIN: self.main_menu.draw,
+            MENU_STATE_HELP: self.help_menu.draw,
+            MENU_STATE_CUSTOM: self.custom_menu.draw,
+            MENU_STATE_ALGORITHM: self.algorithm_menu.draw
+        }
         self.selected_difficulty = None
         
         # Create UI elements
@@ -914,6 +1181,11 @@ class WordLadderGUI:
                                       "Show Path", 
                                       ALGORITHM_COLORS['a_star'])
         }
+        # Everything that tracks hover on the difficulty selection screen
+        self._selection_buttons = [*self.difficulty_buttons.values(), self.game_buttons['menu']]
+        # The difficulty screen's title never moves, so it is laid out once
+        title = render_text("Select Difficulty", 64, PRIMARY_COLOR)
+        self._difficulty_title = (title, title.get_rect(centerx=WINDOW_WIDTH//2, y=100))
         
         self.message = ""
         self.message_color = BLACK
@@ -923,32 +1195,59 @@ class WordLadderGUI:
         self.hint_detail_level = 'basic'
         self.optimal_path = None
         
+        # Rendered message, owned here since its alpha changes while it fades in
+        self._message_surface: Optional[pygame.Surface] = None
+        self._message_rect: Optional[pygame.Rect] = None
+        
+        # Game info text, cached together with the state it was rendered from
+        self._info_panel: Optional[pygame.Surface] = None
+        self._info_panel_key = None
+        self._alg_indicator: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        self._alg_indicator_key: Optional[str] = None
+        
+        # Background circles: fixed x position plus the phase of each sine
+        self._bg_circles = [(int(WINDOW_WIDTH * 0.1 * i), i * 0.5, float(i)) for i in range(10)]
+        # Translucent circle sprite for every radius the animation can reach (10-30)
+        self._bg_circle_sprites: Dict[int, pygame.Surface] = {}
+        for radius in range(10, 31):
+            sprite = to_display_format(pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA))
+            pygame.draw.circle(sprite, (*PRIMARY_COLOR, 30), (radius, radius), radius)
+            self._bg_circle_sprites[radius] = sprite
+            
+        # Set by input; without focus the screen is only redrawn when something happened
+        self._dirty = True
+        # Screen and background circle rects of the last presented frame; None forces a full flip
+        self._presented_state: Optional[str] = None
+        self._presented_circles: List[pygame.Rect] = []
+        
     def draw(self):
         self.screen.fill(BACKGROUND_COLOR)
         self.animation_time += 0.02
         
         # Draw animated background
-        for i in range(10):
-            x = WINDOW_WIDTH * 0.1 * i
-            y = WINDOW_HEIGHT * (0.5 + 0.2 * math.sin(self.animation_time + i * 0.5))
-            radius = 20 + 10 * math.sin(self.animation_time * 2 + i)
-            pygame.draw.circle(self.screen, (*PRIMARY_COLOR, 30), (int(x), int(y)), int(radius))
-        
-        if self.menu_state == MENU_STATE_MAIN:
-            self.main_menu.draw(self.screen)
-        elif self.menu_state == MENU_STATE_HELP:
-            self.help_menu.draw(self.screen)
-        elif self.menu_state == MENU_STATE_CUSTOM:
-            self.custom_menu.draw(self.screen)
-        elif self.menu_state == MENU_STATE_ALGORITHM:
-            self.algorithm_menu.draw(self.screen)
+        t = self.animation_time
+        sin = math.sin
+        sprites = self._bg_circle_sprites
+        circles = []
+        circle_rects = []
+        for x, y_phase, radius_phase in self._bg_circles:
+            y = WINDOW_HEIGHT * (0.5 + 0.2 * sin(t + y_phase))
+            radius = int(20 + 10 * sin(t * 2 + radius_phase))
+            # The screen has no alpha channel, so the translucency has to come from a sprite
+            sprite = sprites[radius]
+            circles.append((sprite, (x - radius, int(y) - radius)))
+            circle_rects.append(sprite.get_rect(x=x - radius, y=int(y) - radius))
+        blit_batch(self.screen, circles)
+        
+        # Screens that only report a few changed areas are presented with update(rects)
+        dirty_rects = None
+        menu_draw = self._menu_draws.get(self.menu_state)
+        if menu_draw is not None:
+            dirty_rects = menu_draw(self.screen)
         elif self.menu_state == MENU_STATE_GAME:
             if not self.game_state:
                 # Draw difficulty selection screen
-                font_title = pygame.font.Font(None, 64)
-                title = font_title.render("Select Difficulty", True, PRIMARY_COLOR)
-                title_rect = title.get_rect(centerx=WINDOW_WIDTH//2, y=100)
-                self.screen.blit(title, title_rect)
+                self.screen.blit(*self._difficulty_title)
                 
                 # Draw difficulty buttons
                 for diff, button in self.difficulty_buttons.items():
@@ -963,65 +1262,90 @@ class WordLadderGUI:
                                    self.game_state['current_word'],
                                    self.game_state['target_word'])
                 
-                # Draw game info
-                font = pygame.font.Font(None, 36)
-                info_text = [
-                    f"Current Word: {self.game_state['current_word']}",
-                    f"Target Word: {self.game_state['target_word']}",
-                    f"Moves: {self.game_state['moves']}/{self.game_state['max_moves']}",
-                    f"Score: {self.score}"
-                ]
+                # Draw game info, rebuilt only when the values shown in it change
+                gs = self.game_state
+                info_key = (gs['current_word'], gs['target_word'], gs['moves'], gs['max_moves'], 
+                            self.score, gs['difficulty'], tuple(gs.get('banned_words') or ()), 
+                            tuple(gs.get('restricted_letters') or ()))
+                if info_key != self._info_panel_key:
+                    self._info_panel = self._render_info_panel()
+                    self._info_panel_key = info_key
+                self.screen.blit(self._info_panel, (PADDING, PADDING))
                 
-                for i, text in enumerate(info_text):
-                    surface = font.render(text, True, BLACK)
-                    self.screen.blit(surface, (PADDING, PADDING + 40*i))
+                # Draw algorithm indicator, laid out again only when the algorithm changes
+                algorithm = self.game.hint_algorithm
+                if algorithm != self._alg_indicator_key:
+                    alg_surface = render_text(f"Hint: {algorithm.upper()}", 36, ALGORITHM_COLORS[algorithm])
+                    self._alg_indicator = (alg_surface, (WINDOW_WIDTH - alg_surface.get_width() - PADDING, PADDING))
+                    self._alg_indicator_key = algorithm
+                self.screen.blit(*self._alg_indicator)
                 
-                # Draw algorithm indicator
-                alg_color = ALGORITHM_COLORS[self.game.hint_algorithm]
-                alg_text = f"Hint: {self.game.hint_algorithm.upper()}"
-                alg_surface = font.render(alg_text, True, alg_color)
-                self.screen.blit(alg_surface, (WINDOW_WIDTH - alg_surface.get_width() - PADDING, PADDING))
-                
-                # Draw obstacles info for Challenge mode
-                if self.game_state['difficulty'] == 'CHALLENGE':
-                    obstacles_y = PADDING + 40*len(info_text) + 20
-                    
-                    if self.game_state.get('banned_words') and len(self.game_state['banned_words']) > 0:
-                        banned_text = f"Banned Words: {', '.join(self.game_state['banned_words'][:3])}"
-                        if len(self.game_state['banned_words']) > 3:
-                            banned_text += f" +{len(self.game_state['banned_words']) - 3} more"
-                        banned_surface = font.render(banned_text, True, ERROR_COLOR)
-                        self.screen.blit(banned_surface, (PADDING, obstacles_y))
-                        obstacles_y += 40
-                    
-                    if self.game_state.get('restricted_letters') and len(self.game_state['restricted_letters']) > 0:
-                        restricted_text = f"Restricted Letters: {', '.join(self.game_state['restricted_letters'])}"
-                        restricted_surface = font.render(restricted_text, True, ERROR_COLOR)
-                        self.screen.blit(restricted_surface, (PADDING, obstacles_y))
-                
-                # Draw input box and buttons
+                # Draw input box and buttons; the buttons go out in one batch
                 self.input_box.draw(self.screen)
-                for button in self.game_buttons.values():
-                    button.draw(self.screen)
+                blit_batch(self.screen, [
+                    *self.game_buttons['menu'].blits(),
+                    *self.game_buttons['hint'].blits(),
+                    *self.game_buttons['algorithm'].blits(),
+                    *self.game_buttons['full_hint'].blits()
+                ])
                 
                 # Draw message
                 if self.message:
                     if self.message_animation < 1:
                         self.message_animation = min(1, self.message_animation + 0.05)
-                    message_surface = font.render(self.message, True, self.message_color)
-                    message_surface.set_alpha(int(255 * self.message_animation))
-                    message_rect = message_surface.get_rect(
-                        centerx=WINDOW_WIDTH//2,
-                        y=WINDOW_HEIGHT//2 - 100
-                    )
-                    self.screen.blit(message_surface, message_rect)
+                    self._message_surface.set_alpha(int(255 * self.message_animation))
+                    self.screen.blit(self._message_surface, self._message_rect)
         
-        pygame.display.flip()
+        # Partial updates are only safe when the previous frame showed the same screen;
+        # the circles' old positions have to be repainted as well as their new ones
+        if dirty_rects is not None and self.menu_state == self._presented_state:
+            pygame.display.update(self._presented_circles + circle_rects + dirty_rects)
+        else:
+            pygame.display.flip()
+        self._presented_state = self.menu_state
+        self._presented_circles = circle_rects
+        
+    def _render_info_panel(self) -> pygame.Surface:
+        """Render the game info and Challenge obstacles text into one Surface."""
+        info_text = [
+            f"Current Word: {self.game_state['current_word']}",
+            f"Target Word: {self.game_state['target_word']}",
+            f"Moves: {self.game_state['moves']}/{self.game_state['max_moves']}",
+            f"Score: {self.score}"
+        ]
+        text_blits = [(render_text(text, 36, BLACK), (0, 40*i)) for i, text in enumerate(info_text)]
+        
+        # Obstacles info for Challenge mode
+        if self.game_state['difficulty'] == 'CHALLENGE':
+            obstacles_y = 40*len(info_text) + 20
+            
+            if self.game_state.get('banned_words') and len(self.game_state['banned_words']) > 0:
+                banned_text = f"Banned Words: {', '.join(self.game_state['banned_words'][:3])}"
+                if len(self.game_state['banned_words']) > 3:
+                    banned_text += f" +{len(self.game_state['banned_words']) - 3} more"
+                text_blits.append((render_text(banned_text, 36, ERROR_COLOR), (0, obstacles_y)))
+                obstacles_y += 40
+            
+            if self.game_state.get('restricted_letters') and len(self.game_state['restricted_letters']) > 0:
+                restricted_text = f"Restricted Letters: {', '.join(self.game_state['restricted_letters'])}"
+                text_blits.append((render_text(restricted_text, 36, ERROR_COLOR), (0, obstacles_y)))
+                
+        width = max(surface.get_width() for surface, _ in text_blits)
+        height = max(y + surface.get_height() for surface, (_, y) in text_blits)
+        panel = to_display_format(pygame.Surface((width, height), pygame.SRCALPHA))
+        blit_batch(panel, text_blits)
+        return panel
         
     def show_message(self, text: str, color: Tuple[int, int, int]):
         self.message = text
         self.message_color = color
         self.message_animation = 0
+        # Hint and optimal-path messages can be long, so render once here; draw only fades it in
+        self._message_surface = to_display_format(get_font(36).render(text, True, color))
+        self._message_rect = self._message_surface.get_rect(
+            centerx=WINDOW_WIDTH//2,
+            y=WINDOW_HEIGHT//2 - 100
+        )
         
     def update_score(self):
         if self.game_state['status'] == 'WON':
@@ -1035,8 +1359,12 @@ class WordLadderGUI:
         
         while running:
             for event in pygame.event.get():
+                self._dirty = True
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    # The window contents were lost, so present the next frame in full
+                    self._presented_state = None
                 
                 if self.menu_state == MENU_STATE_MAIN:
                     new_state = self.main_menu.handle_event(event)
@@ -1073,61 +1401,83 @@ class WordLadderGUI:
                 
                 elif self.menu_state == MENU_STATE_GAME:
                     if not self.game_state:
-                        # Handle difficulty selection
-                        for diff, button in self.difficulty_buttons.items():
-                            if button.handle_event(event):
-                                self.selected_difficulty = diff
-                                self.game_state = self.game.start_game(diff)
-                                self.show_message(f"Transform '{self.game_state['start_word']}' into '{self.game_state['target_word']}'", PRIMARY_COLOR)
-                                break
-                        
-                        # Handle back button
-                        if self.game_buttons['menu'].handle_event(event):
-                            self.menu_state = MENU_STATE_MAIN
+                        # Difficulty selection, again checking the event type only once
+                        if event.type == pygame.MOUSEMOTION:
+                            for button in self._selection_buttons:
+                                button.update_hover(event.pos)
+                                
+                        elif event.type == pygame.MOUSEBUTTONDOWN:
+                            for diff, button in self.difficulty_buttons.items():
+                                if button.handle_event(event):
+                                    self.selected_difficulty = diff
+                                    self.game_state = self.game.start_game(diff)
+                                    self.show_message(f"Transform '{self.game_state['start_word']}' into '{self.game_state['target_word']}'", PRIMARY_COLOR)
+                                    break
+                            
+                            # Handle back button
+                            if self.game_buttons['menu'].was_clicked():
+                                self.menu_state = MENU_STATE_MAIN
                     else:
-                        # Handle game input
-                        if self.game_buttons['menu'].handle_event(event):
-                            self.menu_state = MENU_STATE_MAIN
-                            self.optimal_path = None
-                        elif self.game_buttons['algorithm'].handle_event(event):
-                            self.menu_state = MENU_STATE_ALGORITHM
-                        elif self.game_buttons['hint'].handle_event(event):
-                            if self.game_state['status'] == 'PLAYING':
-                                hint_data = self.game.get_hint(detail_level='basic')
-                                if hint_data and hint_data['next_word']:
-                                    self.show_message(f"Hint: Try '{hint_data['next_word']}' - {hint_data['explanation']}", 
-                                                    ALGORITHM_COLORS[self.game.hint_algorithm])
-                                else:
-                                    self.show_message("No hint available", ERROR_COLOR)
-                        elif self.game_buttons['full_hint'].handle_event(event):
-                            if self.game_state['status'] == 'PLAYING':
-                                hint_data = self.game.get_hint(detail_level='full')
-                                if hint_data and hint_data['full_path']:
-                                    self.optimal_path = hint_data['full_path']
-                                    path_str = " → ".join(self.optimal_path)
-                                    self.show_message(f"Optimal path: {path_str}", 
-                                                    ALGORITHM_COLORS[self.game.hint_algorithm])
-                                else:
-                                    self.show_message("No path available", ERROR_COLOR)
-                        
-                        word = self.input_box.handle_event(event)
-                        if word:
-                            try:
-                                self.game_state = self.game.make_move(word)
-                                # Reset optimal path when a move is made
-                                self.optimal_path = None
+                        # Handle game input, checking the event type once for all widgets
+                        if event.type == pygame.MOUSEMOTION:
+                            for button in self.game_buttons.values():
+                                button.update_hover(event.pos)
                                 
-                                if self.game_state['status'] == 'WON':
-                                    self.update_score()
-                                    self.show_message(f"Congratulations! Score: {self.score}", SUCCESS_COLOR)
-                                elif self.game_state['status'] == 'LOST':
-                                    self.show_message("Game Over! Try again!", ERROR_COLOR)
-                            except ValueError as e:
-                                self.show_message(str(e), ERROR_COLOR)
-                                self.input_box.show_error()
+                        elif event.type == pygame.MOUSEBUTTONDOWN:
+                            if self.game_buttons['menu'].was_clicked():
+                                self.menu_state = MENU_STATE_MAIN
+                                self.optimal_path = None
+                            elif self.game_buttons['algorithm'].was_clicked():
+                                self.menu_state = MENU_STATE_ALGORITHM
+                            elif self.game_buttons['hint'].was_clicked():
+                                if self.game_state['status'] == 'PLAYING':
+                                    hint_data = self.game.get_hint(detail_level='basic')
+                                    if hint_data and hint_data['next_word']:
+                                        self.show_message(f"Hint: Try '{hint_data['next_word']}' - {hint_data['explanation']}", 
+                                                        ALGORITHM_COLORS[self.game.hint_algorithm])
+                                    else:
+                                        # Say why, e.g. no path within the moves left
+                                        self.show_message(hint_data['explanation'], ERROR_COLOR)
+                            elif self.game_buttons['full_hint'].was_clicked():
+                                if self.game_state['status'] == 'PLAYING':
+                                    hint_data = self.game.get_hint(detail_level='full')
+                                    if hint_data and hint_data['full_path']:
+                                        self.optimal_path = hint_data['full_path']
+                                        path_str = " → ".join(self.optimal_path)
+                                        self.show_message(f"Optimal path: {path_str}", 
+                                                        ALGORITHM_COLORS[self.game.hint_algorithm])
+                                    else:
+                                        # Say why, e.g. no path within the moves left
+                                        self.show_message(hint_data['explanation'], ERROR_COLOR)
+                            
+                            # Clicks also move the input box focus
+                            self.input_box.handle_event(event)
+                            
+                        elif event.type == pygame.KEYDOWN:
+                            word = self.input_box.handle_event(event)
+                            if word:
+                                try:
+                                    self.game_state = self.game.make_move(word)
+                                    # Reset optimal path when a move is made
+                                    self.optimal_path = None
+                                    
+                                    if self.game_state['status'] == 'WON':
+                                        self.update_score()
+                                        self.show_message(f"Congratulations! Score: {self.score}", SUCCESS_COLOR)
+                                    elif self.game_state['status'] == 'LOST':
+                                        self.show_message("Game Over! Try again!", ERROR_COLOR)
+                                except ValueError as e:
+                                    self.show_message(str(e), ERROR_COLOR)
+                                    self.input_box.show_error()
             
-            self.draw()
-            clock.tick(60)
+            # Every screen animates its background, so idle frames are the ones nobody is
+            # watching: skip rendering while minimized, and freeze the animations while the
+            # window is in the background until input arrives
+            if pygame.display.get_active() and (self._dirty or pygame.key.get_focused()):
+                self.draw()
+                self._dirty = False
+            # Without input focus nobody is interacting, so let the decorations idle along
+            clock.tick(FPS if pygame.key.get_focused() else IDLE_FPS)
         
         pygame.quit()
         sys.exit()